@@ -1,11 +1,9 @@
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import altair as alt
 
 st.set_page_config(layout="wide")
@@ -14,20 +12,111 @@ st.title("Aircraft Maintenance Dashboard 2024")
 # ==========================
 # Load Dataset
 # ==========================
-df = pd.read_csv("maintenance_data.csv")
+# month labels indexed by month number, 0 is a placeholder
+MONTH_LABELS = np.array(['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+MONTHS = range(1, 13)
+# components shown on the Pareto chart
+PARETO_TOP_N = 30
+
+@st.cache_data
+def load_data(path):
+    # pyarrow parses multi-threaded, and only the columns the dashboard uses are read
+    df = pd.read_csv(
+        path,
+        engine='pyarrow',
+        usecols=['ata_chapter', 'component_name', 'failure_date',
+                 'hours_since_install', 'unscheduled_removal', 'downtime_hours'],
+        parse_dates=['failure_date'],
+        dtype={
+            'component_name': 'category',
+            'ata_chapter': 'category',
+            'unscheduled_removal': 'int8',
+            'downtime_hours': 'float32',
+            'hours_since_install': 'float32'})
+    df['month_num'] = df['failure_date'].dt.month.astype('int8')
+    # keep each component's rows contiguous for the groupbys below
+    df = df.sort_values('component_name', kind='stable').reset_index(drop=True)
+    return df
+
+# ==========================
+# Aggregations
+# ==========================
+# df comes from the cached load_data, so the leading underscore tells
+# Streamlit not to hash the whole frame on every rerun.
+@st.cache_data
+def compute_component_stats(_df):
+    comp_stats = _df.groupby('component_name', sort=False, observed=True).agg(
+        life_sum=('hours_since_install', 'sum'),
+        removals=('unscheduled_removal', 'sum'),
+        downtime=('downtime_hours', 'sum'),
+        mttr=('downtime_hours', 'mean'))
+    # MTBUR, divided in float64
+    comp_stats['mtbur'] = comp_stats['life_sum'].astype('float64') / comp_stats['removals'].clip(lower=1)
+    return comp_stats
+
+# unscheduled_removal is a 0/1 flag, so removal counts only need the removed rows
+@st.cache_data
+def compute_removed(_df):
+    return _df[_df['unscheduled_removal'] == 1]
+
+@st.cache_data
+def compute_pareto(_df, top_n=PARETO_TOP_N):
+    # categorical value_counts keeps components with no removal at 0
+    return compute_removed(_df)['component_name'].value_counts(sort=False).nlargest(top_n)
+
+@st.cache_data
+def compute_monthly_failure(_df):
+    monthly_failure = compute_removed(_df)['month_num'].value_counts(sort=False)
+    return monthly_failure.reindex(MONTHS, fill_value=0)
+
+@st.cache_data
+def compute_failure_per_ata(_df):
+    failure_per_ata = compute_removed(_df)['ata_chapter'].value_counts(sort=False)
+    return failure_per_ata.rename_axis('ata_chapter').rename('unscheduled_removal').reset_index()
+
+@st.cache_data
+def compute_life_arrays(_df):
+    # hours since install split per component, for the explorer histogram
+    return {
+        name: grp['hours_since_install'].to_numpy()
+        for name, grp in _df.groupby('component_name', sort=False, observed=True)
+    }
+
+@st.cache_data
+def compute_life_histograms(_df, bins=15):
+    # (counts, edges) per component
+    return {
+        name: np.histogram(life, bins=bins)
+        for name, life in compute_life_arrays(_df).items()
+    }
+
+@st.cache_data
+def compute_trend_matrix(_df):
+    # month x component removal counts, every month kept on the rows
+    trend_matrix = _df.groupby(['component_name', 'month_num'], sort=False, observed=True)['unscheduled_removal'].sum()
+    trend_matrix = trend_matrix.unstack('component_name', fill_value=0)
+    return trend_matrix.reindex(MONTHS, fill_value=0)
+
+df = load_data("maintenance_data.csv")
+# categories are already the distinct component names, no scan needed
+component_names = df['component_name'].cat.categories.to_numpy()
 
 # ==========================
 # Summary KPIs
 # ==========================
 st.header("Summary KPIs")
 
-total_unsc_removal = df['unscheduled_removal'].sum()
-total_components = df['component_name'].nunique()
-total_downtime = df['downtime_hours'].sum()
+# per component life and removal totals, shared by the KPIs and charts below
+comp_stats = compute_component_stats(df)
 
-# MTBUR
-mtbur = df.groupby('component_name').apply(
-    lambda x: x['hours_since_install'].sum() / max(x['unscheduled_removal'].sum(), 1))
+# scalar KPIs fold the per component totals, no extra pass over df
+total_unsc_removal = comp_stats['removals'].sum()
+total_components = len(comp_stats)
+total_downtime = comp_stats['downtime'].sum()
+
+# MTBUR and MTTR
+mtbur = comp_stats['mtbur']
+mttr = comp_stats['mttr']
 
 # Best and worst component
 best_idx = mtbur.idxmax()
@@ -37,7 +126,7 @@ worst_idx = mtbur.idxmin()
 col1, col2, col3, col4, col5 = st.columns(5)
 col1.metric("Total Unscheduled Removal (2024)", total_unsc_removal)
 col2.metric("Total Components", total_components)
-col3.metric("Total Downtime Hours", round(total_downtime,2))
+col3.metric("Total Downtime Hours", round(float(total_downtime),2))
 col4.metric("Best Component (Highest MTBUR)", best_idx)
 col5.metric("Worst Component (Lowest MTBUR)", worst_idx)
 
@@ -49,19 +138,14 @@ st.header("Charts Section")
 col1, col2 = st.columns(2)
 with col1:
 # 1. Unschedulued Removal per Month
-    df['month'] = pd.to_datetime(df['failure_date']).dt.strftime('%b')
-    # order the month
-    month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct','Nov','Dec']
-    df['month'] = pd.Categorical(df['month'], categories=month_order, ordered=True)
-    monthly_failure = df.groupby('month')['unscheduled_removal'].sum().reset_index()
+    monthly_failure = compute_monthly_failure(df)
    
     st.subheader("Unschedulued Removal per Month")
     
     fig1 = px.bar(
-        monthly_failure,
-        x="month",
-        y="unscheduled_removal",
-        labels={"unscheduled_removal": "Unscheduled Removal Count", "month": "Month"},
+        x=MONTH_LABELS[monthly_failure.index],
+        y=monthly_failure.values,
+        labels={"y": "Unscheduled Removal Count", "x": "Month"},
         color_discrete_sequence=["navy"],
         height=400 
     )
@@ -69,8 +153,7 @@ with col1:
 
 with col2:
 # 2. Failure Count per ATA Chapter
-    df['ata_chapter'] = df['ata_chapter'].astype(str)
-    failure_per_ata = df.groupby('ata_chapter')['unscheduled_removal'].sum().reset_index()
+    failure_per_ata = compute_failure_per_ata(df)
 
     st.subheader("Unschedulued Removal per ATA")
     chart = alt.Chart(failure_per_ata).mark_bar(color="navy").encode(
@@ -82,9 +165,10 @@ with col2:
 st.subheader("Pareto Chart – Unscheduled Removal per Component")
 
 # Pareto
-pareto = df.groupby('component_name')['unscheduled_removal'].sum().sort_values(ascending=False)
-# cumulative percentage
-cumulative_percent = pareto.cumsum()/pareto.sum()*100
+pareto = compute_pareto(df)
+# cumulative percentage of all removals, on a C-contiguous copy of the groupby output
+pareto_values = np.ascontiguousarray(pareto.values)
+cumulative_percent = pareto_values.cumsum()/total_unsc_removal*100
 
 fig = go.Figure()
 
@@ -92,7 +176,7 @@ fig = go.Figure()
 fig.add_trace(
     go.Bar(
         x = pareto.index,
-        y = pareto.values,
+        y = pareto_values,
         name="Unschedule Removal",
         yaxis = "y1",
         marker_color = "navy"
@@ -133,8 +217,7 @@ fig.update_layout(
 st.plotly_chart(fig, use_container_width=True)
 
 # 4. Avg Downtime per Component (MTTR)
-avg_downtime = df.groupby('component_name')['downtime_hours'].mean()
-avg_downtime = avg_downtime.sort_values(ascending=False)
+avg_downtime = mttr.sort_values(ascending=False)
 
 st.subheader("Mean Time To Repair (MTTR)")
 fig = px.bar(
@@ -159,12 +242,11 @@ st.plotly_chart(fig)
 
 # 6. MTBUR vs MTTR Scatter
 st.subheader("MTBUR vs MTTR")
-mttr = df.groupby('component_name')['downtime_hours'].mean()
 
 scatter_df = pd.DataFrame({
-    "component_name": mtbur.index,
-    "MTBUR": mtbur.values,
-    "MTTR": mttr.values
+    "component_name": mtbur.index.values,
+    "MTBUR": np.ascontiguousarray(mtbur.values),
+    "MTTR": np.ascontiguousarray(mttr.reindex(mtbur.index).values)
 })
 
 fig = px.scatter(
@@ -209,34 +291,35 @@ st.plotly_chart(fig, use_container_width=True)
 
 st.header("Component Detail Explorer")
 
-selected_comp = st.selectbox("Select Component", df['component_name'].unique())
-comp_data = df[df['component_name']==selected_comp]
+selected_comp = st.selectbox("Select Component", component_names)
+comp_row = comp_stats.loc[selected_comp]
 
-st.write(f"**Total Unscheduled Removal:** {comp_data['unscheduled_removal'].sum()}")
-st.write(f"**Total Downtime Hours:** {comp_data['downtime_hours'].sum()}")
-comp_mtbur = comp_data['hours_since_install'].sum() / max(comp_data['unscheduled_removal'].sum(),1)
-st.write(f"**MTBUR:** {comp_mtbur:.2f}")
+st.write(f"**Total Unscheduled Removal:** {int(comp_row['removals'])}")
+st.write(f"**Total Downtime Hours:** {round(float(comp_row['downtime']),2)}")
+st.write(f"**MTBUR:** {comp_row['mtbur']:.2f}")
 
 # Life Histogram per Component
-fig= px.histogram(
-    comp_data,
-    x = "hours_since_install", 
-    nbins = 15,
-    labels = {"hours_since_install": "Hours Since Install"},
-    title = "Life Distribution"
+counts, edges = compute_life_histograms(df)[selected_comp]
+fig = go.Figure(
+    go.Bar(
+        x = (edges[:-1] + edges[1:]) / 2,
+        y = counts,
+        width = np.diff(edges)
+    )
 )
 fig.update_traces(marker_color="navy", marker_line_width=1, marker_line_color="white")
 fig.update_layout(
-    xaxis = dict(showgrid= True),
-    yaxis = dict(showgrid= True),
-    bargap = 0.02
+    title = "Life Distribution",
+    xaxis = dict(title = "Hours Since Install", showgrid= True),
+    yaxis = dict(title = "count", showgrid= True)
 )
 st.plotly_chart(fig, use_container_width=True)
 
 # Trend per month
-monthly_trend = comp_data.groupby('month')['unscheduled_removal'].sum()
+trend_matrix = compute_trend_matrix(df)
+monthly_trend = trend_matrix[selected_comp]
 fig = px.line(
-    x = monthly_trend.index,
+    x = MONTH_LABELS[monthly_trend.index],
     y = monthly_trend.values,
     labels ={"x":"Month", "y": "Unscheduled Removal Count"},
     color_discrete_sequence=["navy"],